@@ -1,6 +1,14 @@
-from datetime import datetime, time
-from typing import Union, Optional
-import pytz
+from datetime import datetime, time, tzinfo
+from typing import Dict, Union, Optional
+from zoneinfo import ZoneInfo
+
+# Cache of timezone objects keyed by name, so hot parsing paths don't
+# walk the timezone database on every call
+_TZ_CACHE: Dict[str, tzinfo] = {}
+
+def _get_tz(name: str) -> tzinfo:
+    """Return a cached timezone object for the given name"""
+    return _TZ_CACHE.setdefault(name, ZoneInfo(name))
 
 #from previous project
 class DateUtils:
@@ -8,6 +16,7 @@ class DateUtils:
     functions:
         parse_datetime: Parse a datetime string into a datetime object
         parse_date: Parse a date string into a datetime object
+        parse_date_batch: Parse a batch of date strings into a datetime64 array
         parse_time: Parse a time string into a time object
         format_datetime: Format a datetime object into a standardized string
         format_date: Format a datetime object or string into a date string
@@ -19,8 +28,9 @@ class DateUtils:
     TIME_FORMAT = "%H:%M"
     DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
     
-    # Default timezone
+    # Default timezone (resolved once at class-load time)
     DEFAULT_TIMEZONE = "Europe/Paris"
+    _DEFAULT_TZ = ZoneInfo(DEFAULT_TIMEZONE)
     
     @classmethod
     def parse_datetime(cls, date_str: str, timezone: Optional[str] = None) -> datetime:
@@ -36,8 +46,10 @@ class DateUtils:
             datetime object with timezone information
         """
         try:
-            # Try ISO format first
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            # Try ISO format first (only rewrite the 'Z' suffix when present)
+            if date_str.endswith('Z'):
+                date_str = date_str[:-1] + '+00:00'
+            dt = datetime.fromisoformat(date_str)
         except ValueError:
             try:
                 # Try custom format
@@ -47,9 +59,9 @@ class DateUtils:
         
         # Add timezone if not present
         if dt.tzinfo is None:
-            tz = pytz.timezone(timezone or cls.DEFAULT_TIMEZONE)
-            dt = tz.localize(dt)
-            
+            tz = _get_tz(timezone) if timezone else cls._DEFAULT_TZ
+            dt = dt.replace(tzinfo=tz)
+
         return dt
     
     @classmethod
@@ -63,11 +75,41 @@ class DateUtils:
         Returns:
             datetime object at midnight
         """
+        # Fast path: slice and int-parse the fixed YYYY-MM-DD positions,
+        # avoiding the generic strptime format interpreter
+        if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+            try:
+                return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+            except ValueError:
+                pass
         try:
             return datetime.strptime(date_str, cls.DATE_FORMAT)
         except ValueError:
             raise ValueError(f"Invalid date format: {date_str}. Expected format: {cls.DATE_FORMAT}")
     
+    @classmethod
+    def parse_date_batch(cls, date_strs) -> "numpy.ndarray":
+        """
+        Parse a batch of date strings into a datetime64 array.
+
+        Intended for bulk workloads (e.g. CSV imports) where calling
+        parse_date per element is too slow; the whole batch is parsed in
+        one C-level pass.
+
+        Args:
+            date_strs: Sequence of date strings to parse (YYYY-MM-DD)
+
+        Returns:
+            numpy.ndarray of dtype datetime64[D]
+        """
+        # Deferred import: only bulk callers pay the numpy load cost
+        import numpy
+
+        try:
+            return numpy.asarray(date_strs, dtype='datetime64[D]')
+        except ValueError:
+            raise ValueError(f"Invalid date in batch. Expected format: {cls.DATE_FORMAT}")
+
     @classmethod
     def parse_time(cls, time_str: str) -> time:
         """
@@ -79,6 +121,12 @@ class DateUtils:
         Returns:
             time object
         """
+        # Fast path: slice and int-parse the fixed HH:MM positions
+        if len(time_str) == 5 and time_str[2] == ':':
+            try:
+                return time(int(time_str[0:2]), int(time_str[3:5]))
+            except ValueError:
+                pass
         try:
             return datetime.strptime(time_str, cls.TIME_FORMAT).time()
         except ValueError:
@@ -96,8 +144,7 @@ class DateUtils:
             Formatted datetime string
         """
         if dt.tzinfo is None:
-            tz = pytz.timezone(cls.DEFAULT_TIMEZONE)
-            dt = tz.localize(dt)
+            dt = dt.replace(tzinfo=cls._DEFAULT_TZ)
         return dt.isoformat()
     
     @classmethod
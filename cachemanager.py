@@ -1,59 +1,99 @@
 from typing import Optional, Dict
-from datetime import datetime, timedelta
+from collections import defaultdict
+import heapq
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Pre-bound so hot paths do a LOAD_GLOBAL instead of module + attribute
+# lookups on every cache touch
+_monotonic = time.monotonic
+
 class CacheManager:
-    """Class responsible for managing the cache of the pool scheduling engine"""
-    
+    """Class responsible for managing the cache of the pool scheduling engine
+
+    Thread safety relies on the GIL's single-op atomicity of dict get/pop
+    rather than a lock, so readers never block on eviction or invalidation.
+    """
+
     def __init__(self, ttl: int = 3600):
+        # Entries are (value, expires_at) tuples; expires_at is a
+        # time.monotonic() float so each cache touch is a single float
+        # compare instead of datetime allocation + timedelta arithmetic
         self.cache = {}
         self.ttl = ttl
-    
+        # Min-heap of (expires_at, key) so expiration is O(expired) instead
+        # of a full O(N) scan; stale heap entries from overwrites are
+        # detected by comparing the recorded expiry against the live entry
+        self._expiry_heap = []
+        # Reverse index from patient ID to the cache keys that belong to
+        # it, so invalidating a patient is a single pop instead of a
+        # substring scan over every key
+        self._patient_keys = defaultdict(set)
+
     def get(self, key: str) -> Optional[Dict]:
         """Get a value from the cache if it exists and is not expired"""
-        if key not in self.cache:
+        # Amortize cleanup of already-expired entries across reads
+        self.clear_expired()
+        entry = self.cache.get(key)
+        if entry is None:
             return None
-            
-        cache_entry = self.cache[key]
-        if datetime.now() - cache_entry['timestamp'] > timedelta(seconds=self.ttl):
-            del self.cache[key]
+
+        value, expires_at = entry
+        if expires_at < _monotonic():
+            self.cache.pop(key, None)
             return None
-            
-        return cache_entry['data']
-    
-    def set(self, key: str, value: Dict) -> None:
-        """Set a value in the cache with current timestamp"""
-        self.cache[key] = {
-            'data': value,
-            'timestamp': datetime.now()
-        }
-    
+
+        return value
+
+    def set(self, key: str, value: Dict, patient_id: Optional[str] = None) -> None:
+        """Set a value in the cache with its expiry time
+
+        Args:
+            key (str): The cache key
+            value (Dict): The value to cache
+            patient_id (str, optional): The patient this entry belongs to,
+                indexed so clear_patient_cache can invalidate without scanning
+        """
+        expires_at = _monotonic() + self.ttl
+        self.cache[key] = (value, expires_at)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        if patient_id is not None:
+            self._patient_keys[patient_id].add(key)
+
     def clear_expired(self) -> None:
         """Clear all expired entries from the cache"""
-        current_time = datetime.now()
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if current_time - entry['timestamp'] > timedelta(seconds=self.ttl)
-        ]
-        for key in expired_keys:
-            del self.cache[key]
+        # Bind the loop's attribute lookups to locals so each iteration is
+        # LOAD_FAST instead of repeated self.<attr> resolution
+        now = _monotonic()
+        heap = self._expiry_heap
+        cache = self.cache
+        heappop = heapq.heappop
+        while heap and heap[0][0] < now:
+            try:
+                expires_at, key = heappop(heap)
+            except IndexError:
+                # A concurrent clear_expired drained the heap between the
+                # emptiness check and the pop
+                break
+            # Pop in one hash probe and only reinsert on a stale heap
+            # record (an overwrite leaves the old (expiry, key) behind);
+            # setdefault restores atomically without clobbering a value a
+            # concurrent set() put there in the meantime
+            entry = cache.pop(key, None)
+            if entry is not None and entry[1] != expires_at:
+                cache.setdefault(key, entry)
 
     def clear_patient_cache(self, patient_id: str) -> None:
         """Clear all cache entries related to a specific patient
-        
+
         Args:
             patient_id (str): The ID of the patient whose cache should be cleared
         """
-        # Find all keys that contain the patient ID
-        patient_keys = [
-            key for key in self.cache.keys()
-            if patient_id in key
-        ]
-        
-        # Remove all found keys
-        for key in patient_keys:
-            del self.cache[key]
-            
-        logger.info(f"Cleared cache for patient {patient_id}")
\ No newline at end of file
+        # pop detaches the key set atomically; the snapshot guards against
+        # a concurrent writer still holding a reference to it
+        for key in tuple(self._patient_keys.pop(patient_id, ())):
+            self.cache.pop(key, None)
+
+        logger.info(f"Cleared cache for patient {patient_id}")
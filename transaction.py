@@ -1,14 +1,58 @@
 import logging
-from typing import List, Callable, Optional, Dict, Any
+import sys
+from typing import Deque, List, Callable, Optional, Dict, Any
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Types d'action usuels, déjà internés : le journal ne garde qu'une seule
+# copie de chaque chaîne quelle que soit sa provenance
+_KNOWN_ACTIONS = {t: sys.intern(t) for t in ('create', 'update', 'delete', 'read', 'commit', 'rollback')}
+
 class TransactionError(Exception):
     """Exception raised for transaction-related errors"""
     pass
 
+class _ActionEntry:
+    """Entrée d'action du journal (__slots__ pour réduire l'empreinte mémoire)"""
+    __slots__ = ('type', 'details', 'timestamp')
+
+    def __init__(self, action_type: str, details: Optional[Dict[str, Any]] = None):
+        self.type = action_type
+        self.details = details
+        self.timestamp = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit l'entrée en dictionnaire"""
+        d = {'type': self.type, 'timestamp': self.timestamp}
+        if self.details is not None:
+            d['details'] = self.details
+        return d
+
+class _LogEntry:
+    """Entrée de transaction du journal (__slots__ pour réduire l'empreinte mémoire)"""
+    __slots__ = ('start_time', 'end_time', 'actions', 'rollback', 'status')
+
+    def __init__(self):
+        self.start_time = datetime.now()
+        self.end_time: Optional[datetime] = None
+        self.actions: List[_ActionEntry] = []
+        self.rollback: List[Callable] = []
+        self.status = 'in_progress'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit l'entrée en dictionnaire"""
+        d = {
+            'start_time': self.start_time,
+            'actions': [action.to_dict() for action in self.actions],
+            'status': self.status,
+        }
+        if self.end_time is not None:
+            d['end_time'] = self.end_time
+        return d
+
 class TransactionManager:
     """Gère les transactions et le rollback en cas d'échec
     
@@ -16,71 +60,63 @@ class TransactionManager:
     avec la possibilité de faire un rollback en cas d'erreur.
     
     Attributes:
-        transaction_stack (List[List[Callable]]): Pile des transactions en cours
-        rollback_actions (List[Callable]): Actions de rollback pour la transaction courante
-        transaction_log (List[Dict]): Journal des transactions
+        transaction_log (Deque[_LogEntry]): Journal des transactions ; chaque
+            entrée porte directement ses actions de rollback
     """
-    
+
     def __init__(self):
-        self.transaction_stack: List[List[Callable]] = []
-        self.rollback_actions: List[Callable] = []
-        self.transaction_log: List[Dict[str, Any]] = []
-    
+        self.transaction_log: Deque[_LogEntry] = deque()
+        # Référence directe vers l'entrée de la transaction en cours, pour
+        # éviter de retester et réindexer le journal à chaque appel
+        self._current: Optional[_LogEntry] = None
+
     def begin_transaction(self) -> None:
         """Démarre une nouvelle transaction"""
-        self.transaction_stack.append([])
-        self.transaction_log.append({
-            'start_time': datetime.now(),
-            'actions': [],
-            'status': 'in_progress'
-        })
+        entry = _LogEntry()
+        self.transaction_log.append(entry)
+        self._current = entry
         logger.info("Transaction started")
-    
+
     def add_rollback_action(self, action: Callable) -> None:
         """Ajoute une action de rollback à la transaction courante
-        
+
         Args:
             action (Callable): Fonction à exécuter en cas de rollback
         """
-        if self.transaction_stack:
-            self.transaction_stack[-1].append(action)
-            self.transaction_log[-1]['actions'].append({
-                'type': 'rollback_action',
-                'timestamp': datetime.now()
-            })
-    
+        entry = self._current
+        if entry is not None:
+            entry.rollback.append(action)
+
     def add_action(self, action_type: str, details: Dict[str, Any]) -> None:
         """Ajoute une action au journal de la transaction courante
-        
+
         Args:
             action_type (str): Type d'action (create, update, delete, etc.)
             details (Dict[str, Any]): Détails de l'action
         """
-        if self.transaction_log:
-            self.transaction_log[-1]['actions'].append({
-                'type': action_type,
-                'details': details,
-                'timestamp': datetime.now()
-            })
-    
+        entry = self._current
+        if entry is not None:
+            action_type = _KNOWN_ACTIONS.get(action_type) or sys.intern(action_type)
+            entry.actions.append(_ActionEntry(action_type, details))
+
     def commit(self) -> None:
         """Valide la transaction courante"""
-        if self.transaction_stack:
-            self.transaction_stack.pop()
-            if self.transaction_log:
-                self.transaction_log[-1]['status'] = 'committed'
-                self.transaction_log[-1]['end_time'] = datetime.now()
+        entry = self._current
+        if entry is not None:
+            entry.status = 'committed'
+            entry.end_time = datetime.now()
+            self._current = None
             logger.info("Transaction committed")
-    
+
     def rollback(self) -> None:
         """Annule la transaction courante"""
-        if self.transaction_stack:
-            actions = self.transaction_stack.pop()
-            if self.transaction_log:
-                self.transaction_log[-1]['status'] = 'rolled_back'
-                self.transaction_log[-1]['end_time'] = datetime.now()
-            
-            for action in reversed(actions):
+        entry = self._current
+        if entry is not None:
+            entry.status = 'rolled_back'
+            entry.end_time = datetime.now()
+            self._current = None
+
+            for action in reversed(entry.rollback):
                 try:
                     action()
                 except Exception as e:
@@ -95,7 +131,9 @@ class TransactionManager:
         Returns:
             List[Dict[str, Any]]: Journal des transactions
         """
-        return self.transaction_log
+        # Les entrées sont stockées en objets __slots__ ; la conversion en
+        # dictionnaires ne se fait qu'à la demande
+        return [entry.to_dict() for entry in self.transaction_log]
     
     @contextmanager
     def transaction(self):
@@ -121,7 +159,8 @@ class TransactionManager:
             older_than_days (int): Nombre de jours après lequel les logs sont supprimés
         """
         cutoff_date = datetime.now() - timedelta(days=older_than_days)
-        self.transaction_log = [
-            log for log in self.transaction_log
-            if log['start_time'] > cutoff_date
-        ] 
\ No newline at end of file
+        # Le journal est ordonné par start_time : il suffit de dépiler les
+        # entrées en tête plutôt que de reconstruire toute la liste
+        log = self.transaction_log
+        while log and log[0].start_time <= cutoff_date:
+            log.popleft()
\ No newline at end of file